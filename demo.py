@@ -6,36 +6,84 @@ A focused command-line interface for testing the Neovim DSL commands
 in interactive mode only. Supports multi-line INSERT and enhanced terminal features.
 """
 
+from __future__ import annotations
+
+import socket
 import sys
-import pynvim
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pynvim
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Fall back to the in-tree src directory when the package is not installed.
+# Appending (rather than inserting at 0) keeps stdlib/site-packages lookups
+# for every other import from first probing src/.
+if find_spec("route_about") is None:
+    sys.path.append(str(Path(__file__).parent / "src"))
 
 from route_about.stvim import NvimDSLExecutor
-from route_about.ui import (
-    SimplePrompt,
-    console,
-    show_welcome,
-    show_commands,
-    show_buffer,
-    execute_and_display,
-    show_help,
-    show_history,
-    setup_demo_buffer,
-    show_interactive_instructions,
-)
+
+# The Rich-based UI (route_about.ui) is imported inside the interactive
+# code paths only, so piped runs never pay for loading Rich. pynvim is
+# likewise only imported when connecting, so --help stays fast.
+
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+
+def _tcp_address(socket_path: str) -> Optional[Tuple[str, int]]:
+    """Split host:port into (host, port); return None for a socket path.
+
+    Anything containing "/" is a socket path, even if it ends in :<digits>.
+    Brackets around an IPv6 host ([::1]:6666) are removed.
+    """
+    if "/" in socket_path:
+        return None
+    host, sep, port = socket_path.rpartition(":")
+    if not sep or not port.isdigit():
+        return None
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+    return host or "127.0.0.1", int(port)
+
+
+def _attach(socket_path: str) -> pynvim.Nvim:
+    """Attach to Neovim over a UNIX socket path or a host:port TCP address."""
+    import pynvim
+
+    address = _tcp_address(socket_path)
+    if address is None:
+        return pynvim.attach("socket", path=socket_path)
+
+    host, port = address
+    nvim = pynvim.attach("tcp", address=host, port=port)
+
+    # Disable Nagle's algorithm so small RPC requests are not delayed.
+    # asyncio normally does this already; this is a best-effort guarantee.
+    try:
+        sock = nvim._session.loop._transport.get_extra_info("socket")
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (AttributeError, OSError):
+        pass
+
+    return nvim
 
 
 def connect_to_nvim(socket_path: str = "/tmp/nvim_socket") -> pynvim.Nvim:
     """Connect to a running Neovim instance."""
+    from route_about.ui import console
+
     try:
         with console.status("[bold green]Connecting to Neovim...", spinner="dots"):
-            nvim = pynvim.attach("socket", path=socket_path)
+            nvim = _attach(socket_path)
         console.print(
             f"[green]✓[/green] Connected to Neovim at [cyan]{socket_path}[/cyan]"
         )
+        if _tcp_address(socket_path) is not None:
+            console.print(
+                "[yellow]💡 Tip:[/yellow] A UNIX socket path (e.g. [cyan]/tmp/nvim_socket[/cyan]) has lower latency than TCP"
+            )
         return nvim
     except Exception as e:
         console.print(
@@ -48,10 +96,65 @@ def connect_to_nvim(socket_path: str = "/tmp/nvim_socket") -> pynvim.Nvim:
         sys.exit(1)
 
 
+def piped_mode(socket_path: str):
+    """Execute DSL commands read from a non-interactive stdin.
+
+    Skips all Rich prompting, panels and spinners; each result is printed
+    as a plain line so output can be piped onwards.
+    """
+    try:
+        nvim = _attach(socket_path)
+    except Exception as e:
+        print(f"Error connecting to Neovim at {socket_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    executor = NvimDSLExecutor(nvim)
+    lines = []
+    triple_quote_count = 0
+
+    for line in sys.stdin:
+        line = line.rstrip("\n")
+        lines.append(line)
+
+        # Keep reading while a multi-line string is still open
+        triple_quote_count += line.count('"""')
+        if triple_quote_count % 2 == 1:
+            continue
+
+        cmd = "\n".join(lines).strip()
+        lines = []
+        triple_quote_count = 0
+        if cmd:
+            print(executor.execute(cmd))
+
+
 def interactive_mode(executor: NvimDSLExecutor, nvim: pynvim.Nvim):
     """Run interactive DSL shell."""
+    from route_about.ui import (
+        SimplePrompt,
+        console,
+        show_commands,
+        show_buffer,
+        execute_and_display,
+        show_help,
+        show_history,
+        show_interactive_instructions,
+    )
+
     prompt = SimplePrompt()
 
+    def clear_screen():
+        console.clear()
+        console.print("[green]✓[/green] Screen cleared")
+
+    # Shell commands, keyed by their lowercased name
+    shell_commands = {
+        "help": show_help,
+        "show": lambda: show_buffer(nvim),
+        "clear": clear_screen,
+        "history": lambda: show_history(prompt.history),
+    }
+
     console.print("\n" + "=" * 60)
     show_interactive_instructions()
 
@@ -61,22 +164,15 @@ def interactive_mode(executor: NvimDSLExecutor, nvim: pynvim.Nvim):
     while True:
         try:
             cmd = prompt.get_input("stvim")
+            key = cmd.lower()
 
-            if cmd.lower() in ["quit", "exit", "q"]:
+            if key in QUIT_COMMANDS:
                 console.print("[yellow]👋[/yellow] Thanks for using RouteAbout DSL!")
                 break
-            elif cmd.lower() == "help":
-                show_help()
-                continue
-            elif cmd.lower() == "show":
-                show_buffer(nvim)
-                continue
-            elif cmd.lower() == "clear":
-                console.clear()
-                console.print("[green]✓[/green] Screen cleared")
-                continue
-            elif cmd.lower() == "history":
-                show_history(prompt.history)
+
+            handler = shell_commands.get(key)
+            if handler is not None:
+                handler()
                 continue
             elif cmd == "":
                 continue
@@ -98,20 +194,37 @@ def main():
     socket_path = "/tmp/nvim_socket"
     if len(sys.argv) > 1:
         if sys.argv[1] in ["-h", "--help"]:
+            from route_about.ui import console
+
             console.print(
                 "[bold green]RouteAbout DSL Demo - Interactive Mode[/bold green]"
             )
             console.print("\nUsage:")
             console.print("  python demo.py [socket_path]")
+            console.print("  python demo.py [socket_path] < commands.txt")
             console.print("\nExamples:")
             console.print("  python demo.py                    # Use default socket")
             console.print("  python demo.py /tmp/my_nvim      # Use custom socket")
+            console.print("  python demo.py 127.0.0.1:6666    # Connect over TCP")
+            console.print("  echo 'GOTO LINE 3' | python demo.py   # Piped commands")
             console.print("\nStart Neovim with:")
             console.print("  nvim --listen /tmp/nvim_socket")
             return
         else:
             socket_path = sys.argv[1]
 
+    # Piped input - run commands without the interactive UI
+    if not sys.stdin.isatty():
+        piped_mode(socket_path)
+        return
+
+    from route_about.ui import (
+        console,
+        show_welcome,
+        show_buffer,
+        setup_demo_buffer,
+    )
+
     # Show welcome
     show_welcome()
 
@@ -129,8 +242,8 @@ def main():
 
     # Set up demo buffer
     with console.status("[bold blue]Setting up demo buffer...", spinner="dots"):
-        setup_demo_buffer(nvim)
-    show_buffer(nvim, "Initial Buffer Content")
+        content = setup_demo_buffer(nvim)
+    show_buffer(nvim, "Initial Buffer Content", lines=content)
 
     # Run interactive mode
     interactive_mode(executor, nvim)
@@ -7,6 +7,7 @@ DSL commands against a Neovim instance.
 Main Classes:
     NvimDSLExecutor: Primary interface for executing DSL commands
     NvimDSLTransformer: Handles parse tree transformation
+    CommandResult: Outcome of a single command
 
 Exceptions:
     ExecutorError: Base exception for executor errors
@@ -14,9 +15,15 @@ Exceptions:
     CommandError: Command execution errors
 """
 
-from .executor import NvimDSLExecutor, ExecutorError, GrammarError, CommandError
-from .transformer import NvimDSLTransformer
+from .executor import (
+    NvimDSLExecutor,
+    ExecutorError,
+    GrammarError,
+    CommandError,
+    clear_parse_cache,
+)
 from .commands import (
+    CommandResult,
     visual_lines_command,
     insert_text_command,
     delete_lines_command,
@@ -26,6 +33,7 @@ from .commands import (
     get_command_function,
     list_available_commands,
     COMMAND_REGISTRY,
+    ATOMIC_BUILDERS,
 )
 
 # Main exports - what users typically need
@@ -33,6 +41,7 @@ __all__ = [
     # Primary classes
     "NvimDSLExecutor",
     "NvimDSLTransformer",
+    "CommandResult",
     # Exceptions
     "ExecutorError",
     "GrammarError",
@@ -48,8 +57,20 @@ __all__ = [
     "get_command_function",
     "list_available_commands",
     "COMMAND_REGISTRY",
+    "ATOMIC_BUILDERS",
+    "clear_parse_cache",
 ]
 
+
+def __getattr__(name):
+    # The transformer pulls in Lark; import it only when asked for
+    if name == "NvimDSLTransformer":
+        from .transformer import NvimDSLTransformer
+
+        return NvimDSLTransformer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Package metadata
 __version__ = "0.1.0"
 __author__ = "DSL Project"
@@ -2,14 +2,45 @@
 Individual DSL command implementations.
 
 Each command is implemented as a separate function that takes a pynvim instance
-and command arguments, returning a result message.
+and command arguments, returning a CommandResult.
 """
 
-import pynvim
-from typing import List, Any
+from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Any, Optional, Tuple
 
-def visual_lines_command(nvim: pynvim.Nvim, start_line: int, end_line: int) -> str:
+if TYPE_CHECKING:
+    import pynvim
+
+
+@dataclass(slots=True)
+class CommandResult:
+    """
+    Outcome of a DSL command.
+
+    The message is only formatted when the result is converted to a string,
+    so callers that just check ok never pay for it.
+    """
+
+    ok: bool
+    template: str
+    args: Tuple[Any, ...] = ()
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+
+
+# Raw API calls for nvim_call_atomic, the result reported on success, and
+# the result reported on failure, whose Neovim error message is appended to
+# its args. Builders return None instead when a call has no atomic form.
+AtomicCalls = Tuple[List[list], CommandResult, CommandResult]
+
+
+def visual_lines_command(
+    nvim: pynvim.Nvim, start_line: int, end_line: int
+) -> CommandResult:
     """
     Execute VISUAL LINES start TO end command.
 
@@ -25,91 +56,90 @@ def visual_lines_command(nvim: pynvim.Nvim, start_line: int, end_line: int) -> s
         nvim.command("normal! V")
         nvim.api.win_set_cursor(0, [end_line, 0])
 
-        return f"Selected lines {start_line} to {end_line}"
+        return CommandResult(True, "Selected lines {} to {}", (start_line, end_line))
 
     except Exception as e:
-        return f"Error selecting lines {start_line}-{end_line}: {e}"
+        return CommandResult(
+            False, "Error selecting lines {}-{}: {}", (start_line, end_line, e)
+        )
 
 
-def insert_text_command(nvim: pynvim.Nvim, text: str, line_num: int = None) -> str:
+def insert_text_command(
+    nvim: pynvim.Nvim, text: str, line_num: int = None
+) -> CommandResult:
     """
     Execute INSERT "text" [AT LINE n] command.
 
     Inserts text at cursor position or at specified line.
     Supports both single-line and multi-line text insertion.
-    Uses buffer manipulation for precise line insertion.
+    Uses nvim_buf_set_lines with an empty range to insert in place.
     """
     try:
-        buffer = nvim.current.buffer
-
         # Split text into lines (handles both single and multi-line)
         text_lines = text.split("\n")
 
         if line_num is not None:
-            # Insert at specific line (convert to 0-based indexing)
-            line_idx = line_num - 1
-
-            # Get current lines and insert new text lines
-            current_lines = buffer[:]
-
-            # Insert all lines starting at the specified position
-            for i, text_line in enumerate(text_lines):
-                current_lines.insert(line_idx + i, text_line)
-
-            buffer[:] = current_lines
+            # Insert in place at the specific line (0-based, end-exclusive),
+            # so only the new lines travel over RPC
+            line_idx = max(line_num - 1, 0)
+            nvim.api.buf_set_lines(0, line_idx, line_idx, False, text_lines)
 
             if len(text_lines) == 1:
-                return f"Inserted text at line {line_num}"
+                return CommandResult(True, "Inserted text at line {}", (line_num,))
             else:
-                return f"Inserted {len(text_lines)} lines starting at line {line_num}"
+                return CommandResult(
+                    True,
+                    "Inserted {} lines starting at line {}",
+                    (len(text_lines), line_num),
+                )
         else:
-            # Insert at current cursor position
-            cursor_pos = nvim.api.win_get_cursor(0)
-            current_line = cursor_pos[0] - 1  # Convert to 0-based
-
-            # Insert new lines after current position
-            current_lines = buffer[:]
-
-            # Insert all lines starting after the current line
-            for i, text_line in enumerate(text_lines):
-                current_lines.insert(current_line + 1 + i, text_line)
-
-            buffer[:] = current_lines
+            # Insert new lines after the cursor line. The 1-based cursor row
+            # is the 0-based index of the line below it.
+            current_row = nvim.api.win_get_cursor(0)[0]
+            nvim.api.buf_set_lines(0, current_row, current_row, False, text_lines)
 
             if len(text_lines) == 1:
-                return f"Inserted text at current position"
+                return CommandResult(True, "Inserted text at current position")
             else:
-                return f"Inserted {len(text_lines)} lines at current position"
+                return CommandResult(
+                    True, "Inserted {} lines at current position", (len(text_lines),)
+                )
 
     except Exception as e:
-        return f"Error inserting text: {e}"
+        return CommandResult(False, "Error inserting text: {}", (e,))
 
 
-def delete_command(nvim: pynvim.Nvim) -> str:
+# Deletes the visual selection or the character under the cursor, checking
+# the mode on the Neovim side. Returns whether a visual mode (v, V or
+# Ctrl-V) was active.
+_DELETE_LUA = """
+local visual = vim.api.nvim_get_mode().mode:find("^[vV\\22]") ~= nil
+vim.cmd(visual and "normal! d" or "normal! x")
+return visual
+"""
+
+
+def delete_command(nvim: pynvim.Nvim) -> CommandResult:
     """
     Execute DELETE command (nominal case).
 
     Deletes character under cursor or current visual selection.
-    Behaves like pressing 'x' in Neovim.
+    Behaves like pressing 'x' in Neovim. The mode check and the delete
+    run in a single Lua call rather than two separate RPCs.
     """
     try:
-        # Check if we're in visual mode
-        mode = nvim.api.get_mode()["mode"]
-
-        if "v" in mode.lower():  # Any visual mode (v, V, or Ctrl-V)
-            # Delete visual selection
-            nvim.command("normal! d")
-            return "Deleted visual selection"
+        if nvim.exec_lua(_DELETE_LUA):
+            return CommandResult(True, "Deleted visual selection")
         else:
-            # Delete character under cursor (like 'x')
-            nvim.command("normal! x")
-            return "Deleted character under cursor"
+            return CommandResult(True, "Deleted character under cursor")
 
     except Exception as e:
-        return f"Error deleting: {e}"
+        return CommandResult(False, "Error deleting: {}", (e,))
 
 
-def delete_lines_command(nvim: pynvim.Nvim, start_line: int, end_line: int) -> str:
+def delete_lines_command(
+    nvim: pynvim.Nvim, start_line: int, end_line: int
+) -> CommandResult:
     """
     Execute DELETE LINES start TO end command.
 
@@ -124,13 +154,15 @@ def delete_lines_command(nvim: pynvim.Nvim, start_line: int, end_line: int) -> s
         # Delete lines by setting range to empty list
         nvim.api.buf_set_lines(0, start_idx, end_idx, False, [])
 
-        return f"Deleted lines {start_line} to {end_line}"
+        return CommandResult(True, "Deleted lines {} to {}", (start_line, end_line))
 
     except Exception as e:
-        return f"Error deleting lines {start_line}-{end_line}: {e}"
+        return CommandResult(
+            False, "Error deleting lines {}-{}: {}", (start_line, end_line, e)
+        )
 
 
-def goto_line_command(nvim: pynvim.Nvim, line_num: int) -> str:
+def goto_line_command(nvim: pynvim.Nvim, line_num: int) -> CommandResult:
     """
     Execute GOTO LINE n command.
 
@@ -141,54 +173,415 @@ def goto_line_command(nvim: pynvim.Nvim, line_num: int) -> str:
         # Move cursor to specified line (column 0)
         nvim.api.win_set_cursor(0, [line_num, 0])
 
-        return f"Moved to line {line_num}"
+        return CommandResult(True, "Moved to line {}", (line_num,))
 
     except Exception as e:
-        return f"Error going to line {line_num}: {e}"
+        return CommandResult(False, "Error going to line {}: {}", (line_num, e))
+
+
+# Escapes that make Vim match text literally. After \V (very nomagic) only
+# backslash is special in a pattern, "/" would end the pattern, and "&"
+# and "~" are special in a substitute replacement
+_PATTERN_ESCAPES = str.maketrans({"\\": "\\\\", "/": "\\/"})
+_REPLACEMENT_ESCAPES = str.maketrans({"\\": "\\\\", "/": "\\/", "&": "\\&", "~": "\\~"})
+
+# Lines read per request when scanning the buffer in Python
+_CHUNK_LINES = 4096
+
+
+@lru_cache(maxsize=256)
+def _vim_literal(pattern: str) -> str:
+    """Escape text into a Vim search pattern that matches it literally."""
+    return "\\V" + pattern.translate(_PATTERN_ESCAPES)
 
 
-def find_text_command(nvim: pynvim.Nvim, pattern: str) -> str:
+@lru_cache(maxsize=256)
+def _substitute_command(old_pattern: str, new_text: str) -> str:
+    """Build a whole-buffer :substitute command replacing text literally."""
+    # % = all lines, g = all occurrences per line
+    new_text = new_text.translate(_REPLACEMENT_ESCAPES)
+    return f"%s/{_vim_literal(old_pattern)}/{new_text}/g"
+
+
+def _call_atomic(nvim: pynvim.Nvim, calls: List[list]) -> List[Any]:
+    """Run API calls in one nvim_call_atomic request, raising on failure."""
+    results, error = nvim.api.call_atomic(calls)
+    if error is not None:
+        from pynvim import NvimError
+
+        raise NvimError(error[2])
+    return results
+
+
+def _search_state_calls(patterns: List[str]) -> List[list]:
+    """
+    Build the API calls that leave the search state as Vim's own search does.
+
+    Each pattern is added to the search history and the last one becomes
+    the last search pattern (@/), so n, N and 'hlsearch' pick it up.
+    """
+    calls = [
+        ["nvim_call_function", ["histadd", ["/", _vim_literal(pattern)]]]
+        for pattern in patterns
+    ]
+    calls.append(["nvim_call_function", ["setreg", ["/", _vim_literal(patterns[-1])]]])
+    return calls
+
+
+def _read_for_literal_match(
+    nvim: pynvim.Nvim, pattern: str, calls: List[list]
+) -> Optional[List[Any]]:
+    """
+    Run read-only API calls alongside the 'ignorecase' option in one request.
+
+    Returns the call results, or None when 'ignorecase' would change how
+    the pattern matches and the caller should defer to Neovim's search.
+    """
+    ignorecase, *results = _call_atomic(
+        nvim, [["nvim_get_option_value", ["ignorecase", {}]], *calls]
+    )
+    if ignorecase and pattern.lower() != pattern.upper():
+        return None
+    return results
+
+
+def _find_literal(nvim: pynvim.Nvim, pattern: str) -> Optional[CommandResult]:
+    """
+    Find the next plain-text match after the cursor in Python.
+
+    Mirrors search() with the "W" flag: the match must start after the
+    cursor and the search does not wrap. The buffer is read in chunks of
+    _CHUNK_LINES from the cursor onwards, stopping at the first match.
+    Like /, a match sets the jumplist mark, the last search pattern, the
+    search history and the search direction, in the same request that
+    moves the cursor. Returns None to defer to Neovim.
+    """
+    results = _read_for_literal_match(
+        nvim,
+        pattern,
+        [
+            ["nvim_win_get_cursor", [0]],
+            ["nvim_buf_get_lines", [0, 0, _CHUNK_LINES, False]],
+        ],
+    )
+    if results is None:
+        return None
+
+    (row, col), lines = results
+    get_lines = nvim.api.buf_get_lines
+    start = 0
+    if row > len(lines):
+        # Cursor lies past the first chunk - continue from its line instead
+        start = row - 1
+        lines = get_lines(0, start, start + _CHUNK_LINES, False)
+
+    # Cursor columns are byte offsets; convert to and from str indices.
+    # The match must start past the whole character under the cursor,
+    # which may span several bytes.
+    offset = row - 1 - start
+    line = lines[offset]
+    from_idx = len(line.encode()[:col].decode(errors="ignore")) + 1
+    while True:
+        for i in range(offset, len(lines)):
+            line = lines[i]
+            idx = line.find(pattern, from_idx)
+            if idx >= 0:
+                line_num = start + i + 1
+                _call_atomic(
+                    nvim,
+                    [
+                        ["nvim_command", ["normal! m'"]],
+                        [
+                            "nvim_win_set_cursor",
+                            [0, [line_num, len(line[:idx].encode())]],
+                        ],
+                        *_search_state_calls([pattern]),
+                        ["nvim_set_vvar", ["searchforward", 1]],
+                    ],
+                )
+                return CommandResult(True, "Found '{}' at line {}", (pattern, line_num))
+            from_idx = 0
+
+        if len(lines) < _CHUNK_LINES:
+            return CommandResult(False, "Pattern '{}' not found", (pattern,))
+        start += len(lines)
+        offset = 0
+        lines = get_lines(0, start, start + _CHUNK_LINES, False)
+
+
+def _replace_literal(
+    nvim: pynvim.Nvim, replacements: List[Tuple[str, str]]
+) -> Optional[List[bool]]:
+    """
+    Apply plain-text replacements in Python with str.replace.
+
+    Each line gets the replacements applied in order, which gives the same
+    buffer as running them one after another, in a single pass. The buffer
+    is streamed in chunks of _CHUNK_LINES, so memory stays bounded by the
+    chunk size rather than the buffer size. Each chunk's write-back (only
+    the span of lines that changed) travels in the same request as the read
+    of the next chunk. Matches never span lines, so nothing needs carrying
+    across chunk boundaries.
+
+    Like running :s for each replacement in turn, the patterns go into the
+    search history, the last one becomes the last search pattern, and the
+    cursor ends on the first non-blank of the last line the last matching
+    replacement changed. These travel with the final write-back.
+
+    Returns whether each replacement matched anything, or None to defer to
+    Neovim's substitute.
+    """
+    results = _read_for_literal_match(
+        nvim,
+        "".join(old_pattern for old_pattern, _ in replacements),
+        [["nvim_buf_get_lines", [0, 0, _CHUNK_LINES, False]]],
+    )
+    if results is None:
+        return None
+
+    (lines,) = results
+    start = 0
+    found = [False] * len(replacements)
+    # Where :s would leave the cursor: the last line matched by the
+    # highest-numbered replacement that matched at all
+    cursor_k, cursor_row, cursor_line = 0, None, None
+    while True:
+        calls = []
+        changed = {}
+        for i, line in enumerate(lines):
+            original = line
+            matched = -1
+            for k, (old_pattern, new_text) in enumerate(replacements):
+                if old_pattern in line:
+                    found[k] = True
+                    line = line.replace(old_pattern, new_text)
+                    matched = k
+            if matched >= cursor_k:
+                cursor_k, cursor_row, cursor_line = matched, start + i, line
+            if line is not original:
+                changed[i] = line
+
+        if changed:
+            first, last = min(changed), max(changed) + 1
+            new_lines = [changed.get(i, lines[i]) for i in range(first, last)]
+            calls.append(
+                [
+                    "nvim_buf_set_lines",
+                    [0, start + first, start + last, False, new_lines],
+                ]
+            )
+
+        # Replacing never adds or removes lines, so indices stay valid
+        more = len(lines) == _CHUNK_LINES
+        start += len(lines)
+        if more:
+            calls.append(
+                ["nvim_buf_get_lines", [0, start, start + _CHUNK_LINES, False]]
+            )
+        else:
+            calls.extend(_search_state_calls([old for old, _ in replacements]))
+            if cursor_row is not None:
+                # Leading blanks are ASCII, so the str index is the byte column
+                col = len(cursor_line) - len(cursor_line.lstrip(" \t"))
+                calls.append(["nvim_win_set_cursor", [0, [cursor_row + 1, col]]])
+
+        results = _call_atomic(nvim, calls)
+        if not more:
+            break
+        lines = results[-1]
+
+    return found
+
+
+def find_text_command(nvim: pynvim.Nvim, pattern: str) -> CommandResult:
     """
     Execute FIND "pattern" command.
 
-    Searches for the specified pattern and moves cursor to first match.
-    Uses Neovim's search command (/) for consistency with editor behavior.
+    Searches for the specified text (matched literally) and moves cursor to
+    first match. The buffer is scanned in Python; Neovim's search command
+    (/) with a very-nomagic pattern is used when 'ignorecase' applies.
     """
+    if not pattern:
+        # \V alone is a zero-width pattern that matches at every position
+        return CommandResult(
+            False, "Error searching for '{}': {}", (pattern, "Empty pattern")
+        )
+
     try:
+        result = _find_literal(nvim, pattern)
+        if result is not None:
+            return result
+
         # Use Neovim's search command
         # The 'n' flag means don't jump to match, 'W' means don't wrap
-        search_result = nvim.call("search", pattern, "nW")
+        vim_pattern = _vim_literal(pattern)
+        search_result = nvim.call("search", vim_pattern, "nW")
 
         if search_result > 0:
             # Pattern found, move cursor to match
-            nvim.command(f"/{pattern}")
-            return f"Found '{pattern}' at line {search_result}"
+            nvim.command(f"/{vim_pattern}")
+            return CommandResult(
+                True, "Found '{}' at line {}", (pattern, search_result)
+            )
         else:
-            return f"Pattern '{pattern}' not found"
+            return CommandResult(False, "Pattern '{}' not found", (pattern,))
 
     except Exception as e:
-        return f"Error searching for '{pattern}': {e}"
+        return CommandResult(False, "Error searching for '{}': {}", (pattern, e))
+
+
+def _replaced(old_pattern: str, new_text: str) -> CommandResult:
+    """Result for a successful REPLACE."""
+    return CommandResult(True, "Replaced all '{}' with '{}'", (old_pattern, new_text))
+
+
+def _replace_failed(old_pattern: str, new_text: str, error: Any) -> CommandResult:
+    """Result for a failed REPLACE."""
+    return CommandResult(
+        False, "Error replacing '{}' with '{}': {}", (old_pattern, new_text, error)
+    )
 
 
-def replace_text_command(nvim: pynvim.Nvim, old_pattern: str, new_text: str) -> str:
+def replace_text_command(
+    nvim: pynvim.Nvim, old_pattern: str, new_text: str
+) -> CommandResult:
     """
     Execute REPLACE "old" WITH "new" command.
 
-    Replaces all occurrences of old pattern with new text.
-    Uses Neovim's substitute command (:s) for powerful replacement.
+    Replaces all occurrences of old text with new text, both taken
+    literally. Runs as str.replace over the buffer lines; Neovim's
+    substitute command (:s) is used when 'ignorecase' applies.
     """
+    if not old_pattern:
+        # \V alone is a zero-width pattern: :s///g would insert new_text
+        # at every position of every line
+        return _replace_failed(old_pattern, new_text, "Empty pattern")
+
     try:
+        found = _replace_literal(nvim, [(old_pattern, new_text)])
+        if found is not None:
+            if not found[0]:
+                raise ValueError(f"Pattern not found: {old_pattern}")
+            return _replaced(old_pattern, new_text)
+
         # Use substitute command to replace all occurrences in file
-        # %s = all lines, g = all occurrences per line
-        substitute_cmd = f"%s/{old_pattern}/{new_text}/g"
+        nvim.command(_substitute_command(old_pattern, new_text))
 
-        # Execute the substitute command
-        nvim.command(substitute_cmd)
+        return _replaced(old_pattern, new_text)
+
+    except Exception as e:
+        return _replace_failed(old_pattern, new_text, e)
 
-        return f"Replaced all '{old_pattern}' with '{new_text}'"
 
+def replace_text_chain(
+    nvim: pynvim.Nvim, replacements: List[Tuple[str, str]]
+) -> List[CommandResult]:
+    """
+    Execute a run of plain-text REPLACE commands in one pass over the buffer.
+
+    Equivalent to calling replace_text_command for each (old, new) pair in
+    order, but the buffer is read and written once for the whole run rather
+    than once per command. Every old pattern must be non-empty.
+
+    Returns:
+        One result per replacement
+    """
+    try:
+        found = _replace_literal(nvim, replacements)
     except Exception as e:
-        return f"Error replacing '{old_pattern}' with '{new_text}': {e}"
+        return [_replace_failed(*pair, e) for pair in replacements]
+
+    if found is None:
+        # 'ignorecase' applies - let each command use Neovim's substitute
+        return [replace_text_command(nvim, *pair) for pair in replacements]
+
+    return [
+        _replaced(*pair)
+        if matched
+        else _replace_failed(*pair, f"Pattern not found: {pair[0]}")
+        for pair, matched in zip(replacements, found)
+    ]
+
+
+# Atomic call builders
+#
+# Commands that only write to Neovim (no read feeding a later step) can also
+# be expressed as a list of raw API calls. The executor packs consecutive
+# commands like these into a single nvim_call_atomic request instead of one
+# round-trip per call. Each builder mirrors its command function above,
+# including its error message, and returns None when a particular call has
+# no atomic form.
+
+
+def visual_lines_calls(start_line: int, end_line: int) -> AtomicCalls:
+    """Build the API calls for VISUAL LINES start TO end."""
+    calls = [
+        ["nvim_win_set_cursor", [0, [start_line, 0]]],
+        ["nvim_command", ["normal! V"]],
+        ["nvim_win_set_cursor", [0, [end_line, 0]]],
+    ]
+    return (
+        calls,
+        CommandResult(True, "Selected lines {} to {}", (start_line, end_line)),
+        CommandResult(False, "Error selecting lines {}-{}: {}", (start_line, end_line)),
+    )
+
+
+def insert_text_calls(text: str, line_num: int = None) -> Optional[AtomicCalls]:
+    """Build the API calls for INSERT "text" AT LINE n.
+
+    Inserting at the cursor has to read the cursor first, so it has no
+    atomic form and returns None.
+    """
+    if line_num is None:
+        return None
+
+    text_lines = text.split("\n")
+    line_idx = max(line_num - 1, 0)
+    calls = [["nvim_buf_set_lines", [0, line_idx, line_idx, False, text_lines]]]
+    failure = CommandResult(False, "Error inserting text: {}")
+    if len(text_lines) == 1:
+        return (
+            calls,
+            CommandResult(True, "Inserted text at line {}", (line_num,)),
+            failure,
+        )
+    return (
+        calls,
+        CommandResult(
+            True, "Inserted {} lines starting at line {}", (len(text_lines), line_num)
+        ),
+        failure,
+    )
+
+
+def delete_lines_calls(start_line: int, end_line: int) -> AtomicCalls:
+    """Build the API calls for DELETE LINES start TO end."""
+    calls = [["nvim_buf_set_lines", [0, start_line - 1, end_line, False, []]]]
+    return (
+        calls,
+        CommandResult(True, "Deleted lines {} to {}", (start_line, end_line)),
+        CommandResult(False, "Error deleting lines {}-{}: {}", (start_line, end_line)),
+    )
+
+
+def goto_line_calls(line_num: int) -> AtomicCalls:
+    """Build the API calls for GOTO LINE n."""
+    calls = [["nvim_win_set_cursor", [0, [line_num, 0]]]]
+    return (
+        calls,
+        CommandResult(True, "Moved to line {}", (line_num,)),
+        CommandResult(False, "Error going to line {}: {}", (line_num,)),
+    )
+
+
+# Maps command functions to their atomic call builders
+ATOMIC_BUILDERS = {
+    visual_lines_command: visual_lines_calls,
+    insert_text_command: insert_text_calls,
+    delete_lines_command: delete_lines_calls,
+    goto_line_command: goto_line_calls,
+}
 
 
 # Command registry - maps command names to their implementations
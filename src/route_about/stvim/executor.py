@@ -5,12 +5,125 @@ This module handles grammar loading, parsing, and coordination between
 the parser and transformer components.
 """
 
-import pynvim
-from lark import Lark
-from typing import List
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 from pathlib import Path
 
-from .transformer import NvimDSLTransformer
+from .commands import (
+    ATOMIC_BUILDERS,
+    CommandResult,
+    delete_command,
+    delete_lines_command,
+    find_text_command,
+    goto_line_command,
+    insert_text_command,
+    replace_text_chain,
+    replace_text_command,
+    visual_lines_command,
+)
+
+# pynvim and Lark are only imported once an executor is built, so importing
+# the package stays cheap for callers that never execute anything
+if TYPE_CHECKING:
+    import pynvim
+    from lark import Lark, Tree
+
+    from .transformer import Operation
+
+
+# Whitespace as the grammar's %ignore WS sees it
+_WS = r"[ \t\f\r\n]"
+
+# Argument patterns matching the grammar's NUMBER and STRING terminals. The
+# string pattern is equivalent to Lark's ESCAPED_STRING: no newlines, and it
+# ends at the first quote preceded by an even number of backslashes. It never
+# matches a triple-quoted string, so multi-line INSERTs always go to Lark.
+_NUMBER = r"(\d+)"
+_STRING = r'("(?:[^"\\\n]|\\.)*")'
+
+
+def _unquote(token: str) -> str:
+    """Drop the quotes around a STRING match."""
+    return token[1:-1]
+
+
+# Single commands recognized without Lark, with a converter per argument.
+# Each must accept a subset of what the grammar accepts; anything else
+# (several commands in one string, unusual spacing) falls through to Lark.
+_FAST_PATHS = tuple(
+    (
+        re.compile(pattern.replace(" ", f"{_WS}+"), re.IGNORECASE | re.ASCII),
+        command,
+        converters,
+    )
+    for pattern, command, converters in (
+        (f"GOTO LINE {_NUMBER}", goto_line_command, (int,)),
+        ("DELETE", delete_command, ()),
+        (f"DELETE LINES {_NUMBER} TO {_NUMBER}", delete_lines_command, (int, int)),
+        (f"VISUAL LINES {_NUMBER} TO {_NUMBER}", visual_lines_command, (int, int)),
+        (
+            f"INSERT {_STRING}(?: AT LINE {_NUMBER})?",
+            insert_text_command,
+            (_unquote, int),
+        ),
+        (f"FIND {_STRING}", find_text_command, (_unquote,)),
+        (
+            f"REPLACE {_STRING} WITH {_STRING}",
+            replace_text_command,
+            (_unquote, _unquote),
+        ),
+    )
+)
+
+
+def _fast_compile(dsl_command: str) -> Optional[List[Operation]]:
+    """Compile a common single command by regex, or return None."""
+    dsl_command = dsl_command.strip(" \t\f\r\n")
+    for pattern, command, converters in _FAST_PATHS:
+        match = pattern.fullmatch(dsl_command)
+        if match is not None:
+            args = tuple(
+                None if value is None else convert(value)
+                for convert, value in zip(converters, match.groups())
+            )
+            return [(command, args)]
+    return None
+
+
+@lru_cache(maxsize=8)
+def _get_parser(grammar_path: str, mtime_ns: int) -> Lark:
+    """
+    Build the LALR parser for a grammar file, shared by all executors.
+
+    The file's mtime is part of the key, so an edited grammar gets a fresh
+    parser. Lark's own on-disk cache also lets the first build in a new
+    process skip LALR table generation.
+    """
+    from lark import Lark
+
+    with open(grammar_path, "r") as f:
+        grammar_content = f.read()
+
+    return Lark(grammar_content, parser="lalr", cache=True)
+
+
+@lru_cache(maxsize=1024)
+def _cached_parse(parser: Lark, dsl_command: str) -> Tree:
+    """
+    Parse a DSL command, memoized on the parser and raw command string.
+
+    Keying on the parser instance means a reloaded grammar never serves
+    trees built by the previous parser.
+    """
+    return parser.parse(dsl_command)
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized parse trees."""
+    _cached_parse.cache_clear()
 
 
 class NvimDSLExecutor:
@@ -29,11 +142,20 @@ class NvimDSLExecutor:
             nvim_instance: Connected pynvim.Nvim instance
             grammar_file: Path to .lark grammar file (optional)
         """
+        from .transformer import NvimDSLTransformer
+
         self.nvim = nvim_instance
+        # pynvim builds a new callable on every nvim.api attribute access;
+        # bind the one the batching loop uses once
+        self._call_atomic = nvim_instance.api.call_atomic
         self.grammar_file = self._resolve_grammar_file(grammar_file)
         self.parser = self._load_parser()
         self.transformer = NvimDSLTransformer(nvim_instance)
 
+        # Single-slot (command, parser, tree) cache in front of the LRU,
+        # for the same command issued twice in a row
+        self._last_parse = None
+
     def _resolve_grammar_file(self, grammar_file: str = None) -> Path:
         """
         Resolve the path to the grammar file.
@@ -60,20 +182,44 @@ class NvimDSLExecutor:
         """
         Load the Lark parser from the grammar file.
 
+        Parsers are shared between executors and only rebuilt when the
+        grammar file changes.
+
         Returns:
             Configured Lark parser instance
         """
         try:
-            with open(self.grammar_file, "r") as f:
-                grammar_content = f.read()
-
-            return Lark(grammar_content, parser="lalr")
+            return _get_parser(
+                str(self.grammar_file.resolve()),
+                self.grammar_file.stat().st_mtime_ns,
+            )
 
         except FileNotFoundError:
             raise FileNotFoundError(f"Grammar file not found: {self.grammar_file}")
         except Exception as e:
             raise RuntimeError(f"Error loading grammar: {e}")
 
+    def parse(self, dsl_command: str) -> Tree:
+        """
+        Parse a DSL command into a parse tree.
+
+        Parse trees are cached per command string, so repeated commands
+        skip the lexer and parser entirely.
+
+        Args:
+            dsl_command: DSL command string to parse
+
+        Returns:
+            Lark Tree object representing the parsed command
+        """
+        last = self._last_parse
+        if last is not None and last[0] == dsl_command and last[1] is self.parser:
+            return last[2]
+
+        parse_tree = _cached_parse(self.parser, dsl_command)
+        self._last_parse = (dsl_command, self.parser, parse_tree)
+        return parse_tree
+
     def execute(self, dsl_command: str) -> str:
         """
         Parse and execute a DSL command.
@@ -85,36 +231,189 @@ class NvimDSLExecutor:
             Result message from command execution
         """
         try:
-            # Parse the command
-            parse_tree = self.parser.parse(dsl_command)
+            return str(self._run_operations(self.compile(dsl_command)))
+        except Exception as e:
+            return f"Error executing '{dsl_command}': {e}"
+
+    def compile(self, dsl_command: str) -> List[Operation]:
+        """
+        Compile a DSL command into operations without executing it.
 
-            # Transform and execute
-            result = self.transformer.transform(parse_tree)
+        The most common single commands are recognized by a regex fast path
+        that skips Lark entirely; everything else is parsed and transformed.
 
-            # Return the result (should be a list with one item)
-            if isinstance(result, list) and len(result) > 0:
-                return result[0]
-            else:
-                return str(result)
+        Args:
+            dsl_command: DSL command string to compile
 
+        Returns:
+            List of (command_function, args) operations
+        """
+        operations = _fast_compile(dsl_command)
+        if operations is None:
+            operations = self.transformer.compile(self.parse(dsl_command))
+        return operations
+
+    def execute_tree(self, parse_tree: Tree) -> str:
+        """
+        Execute an already parsed DSL command.
+
+        Args:
+            parse_tree: Tree returned by parse()
+
+        Returns:
+            Result message from command execution
+        """
+        try:
+            return str(self._run_tree(parse_tree))
         except Exception as e:
-            return f"Error executing '{dsl_command}': {e}"
+            return f"Error executing command: {e}"
+
+    def _run_tree(self, parse_tree: Tree) -> CommandResult:
+        """Compile a parse tree and execute its commands."""
+        return self._run_operations(self.transformer.compile(parse_tree))
+
+    def _run_operations(self, operations: List[Operation]) -> CommandResult:
+        """Execute compiled operations, returning the first result.
+
+        Goes through the same nvim_call_atomic packing as execute_batch, so
+        a multi-call command (e.g. VISUAL LINES) is a single round-trip.
+        The grammar requires at least one command, so there is always a
+        first result.
+        """
+        return self._run_atomic(operations)[0]
 
-    def execute_batch(self, commands: List[str]) -> List[str]:
+    def execute_batch(
+        self, commands: List[str], stringify: bool = True
+    ) -> List[str] | List[CommandResult]:
         """
         Execute multiple DSL commands in sequence.
 
         Args:
             commands: List of DSL command strings
+            stringify: Format each result as a message. Pass False to get
+                the CommandResult objects and skip formatting entirely.
 
         Returns:
-            List of result messages
+            List of result messages (or CommandResults)
         """
-        results = []
+        # Parse and compile the whole batch up front - neither depends on
+        # editor state, so only the Neovim-side work remains in the loop.
+        # Commands are compiled individually rather than joined into one
+        # string, so a malformed command cannot merge with its neighbour.
+        compiled = []
         for cmd in commands:
-            results.append(self.execute(cmd))
+            try:
+                compiled.append(self.compile(cmd))
+            except Exception as e:
+                compiled.append(e)
+
+        # Flatten into one operation stream, remembering which command each
+        # operation came from, so atomic runs can span command boundaries
+        results = [None] * len(commands)
+        operations = []
+        owners = []
+        for index, (cmd, compiled_ops) in enumerate(zip(commands, compiled)):
+            if isinstance(compiled_ops, Exception):
+                results[index] = CommandResult(
+                    False, "Error executing '{}': {}", (cmd, compiled_ops)
+                )
+            else:
+                operations.extend(compiled_ops)
+                owners.extend([index] * len(compiled_ops))
+
+        # Each command reports the result of its first operation. The
+        # grammar requires at least one command, so every compiled command
+        # has one.
+        for index, result in zip(owners, self._run_atomic(operations)):
+            if results[index] is None:
+                results[index] = result
+
+        return [str(result) for result in results] if stringify else results
+
+    def _run_atomic(self, operations: List[Operation]) -> List[CommandResult]:
+        """
+        Execute operations, packing consecutive write-only commands into a
+        single nvim_call_atomic request and consecutive REPLACEs
+        into a single pass over the buffer.
+
+        Args:
+            operations: Compiled operations to execute in order
+
+        Returns:
+            One result per operation
+        """
+        nvim = self.nvim
+        results = []
+        i = 0
+        while i < len(operations):
+            # Consecutive REPLACEs share one pass over the buffer
+            j = i
+            while j < len(operations) and self._is_chainable_replace(operations[j]):
+                j += 1
+            if j - i > 1:
+                replacements = [args for _, args in operations[i:j]]
+                results.extend(replace_text_chain(nvim, replacements))
+                i = j
+                continue
+
+            # Collect the run of atomic-capable operations starting at i
+            calls = []
+            spans = []
+            j = i
+            while j < len(operations):
+                command, args = operations[j]
+                builder = ATOMIC_BUILDERS.get(command)
+                built = builder(*args) if builder is not None else None
+                if built is None:
+                    break
+                op_calls, message, failure = built
+                calls.extend(op_calls)
+                spans.append((len(calls), message, failure))
+                j += 1
+
+            if j == i:
+                command, args = operations[i]
+                results.append(command(nvim, *args))
+                i += 1
+                continue
+
+            try:
+                _, error = self._call_atomic(calls)
+            except Exception:
+                # Request-level failure (e.g. no nvim_call_atomic) - run the
+                # operations one by one instead
+                results.extend(self.transformer.run(operations[i:j]))
+                i = j
+                continue
+
+            if error is None:
+                results.extend(message for _, message, _ in spans)
+                i = j
+                continue
+
+            # nvim_call_atomic stops at the first failing call. Operations
+            # before it succeeded. The failing one's earlier calls have
+            # already run, so it is not re-run; its error result is built
+            # from Neovim's message instead. Carry on after it.
+            failed = next(k for k, (end, _, _) in enumerate(spans) if error[0] < end)
+            results.extend(message for _, message, _ in spans[:failed])
+            failure = spans[failed][2]
+            results.append(
+                CommandResult(False, failure.template, (*failure.args, error[2]))
+            )
+            i += failed + 1
+
         return results
 
+    @staticmethod
+    def _is_chainable_replace(operation: Operation) -> bool:
+        """Check whether an operation is a REPLACE with a non-empty pattern.
+
+        Empty patterns are left to replace_text_command, which rejects them.
+        """
+        command, args = operation
+        return command is replace_text_command and bool(args[0])
+
     def validate_command(self, dsl_command: str) -> bool:
         """
         Validate a DSL command without executing it.
@@ -126,7 +425,7 @@ class NvimDSLExecutor:
             True if command is valid, False otherwise
         """
         try:
-            self.parser.parse(dsl_command)
+            self.parse(dsl_command)
             return True
         except Exception:
             return False
@@ -141,13 +440,14 @@ class NvimDSLExecutor:
         Returns:
             Lark Tree object representing the parsed command
         """
-        return self.parser.parse(dsl_command)
+        return self.parse(dsl_command)
 
     def reload_grammar(self):
         """
         Reload the grammar file and recreate the parser.
 
-        Useful for development when the grammar is being modified.
+        Useful for development when the grammar is being modified. A new
+        parser is only built if the file has changed since it was loaded.
         """
         self.parser = self._load_parser()
 
@@ -2,14 +2,19 @@
 Base transformer class for converting DSL parse trees into Neovim operations.
 
 This module handles the tree transformation logic and delegates actual
-command execution to the command implementations.
+command execution to the command implementations. Parse trees are first
+compiled into (command_function, args) operations, which are then run
+against the Neovim instance.
 """
 
-import pynvim
-from lark import Transformer
-from typing import Any, List
+from __future__ import annotations
+
+from lark import Transformer, Tree, v_args
+from lark.exceptions import GrammarError, VisitError
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
 
 from .commands import (
+    CommandResult,
     visual_lines_command,
     insert_text_command,
     delete_command,
@@ -19,15 +24,39 @@ from .commands import (
     replace_text_command,
 )
 
+if TYPE_CHECKING:
+    import pynvim
+
+# A compiled command: the command function and its arguments (minus nvim)
+Operation = Tuple[Callable[..., CommandResult], Tuple[Any, ...]]
+
 
 class NvimDSLTransformer(Transformer):
     """
     Transformer class that converts DSL parse trees into actual Neovim operations.
 
     This class handles the tree transformation and delegates command execution
-    to individual command functions for better modularity.
+    to individual command functions for better modularity. Rule handlers only
+    build operations; nothing touches Neovim until the operations are run.
     """
 
+    # Grammar rules and terminals with a handler below. Lark looks each
+    # handler up with getattr on every node; these are bound once instead.
+    _RULES = (
+        "start",
+        "command",
+        "visual_lines",
+        "insert_text",
+        "delete_command",
+        "delete_target",
+        "lines_range",
+        "goto_line",
+        "find_text",
+        "replace_text",
+        "at_line",
+    )
+    _TERMINALS = ("STRING", "MULTILINE_STRING", "NUMBER")
+
     def __init__(self, nvim_instance: pynvim.Nvim):
         """
         Initialize the transformer with a pynvim instance.
@@ -37,94 +66,125 @@ class NvimDSLTransformer(Transformer):
         """
         super().__init__()
         self.nvim = nvim_instance
-
-    def start(self, items: List[Any]) -> List[Any]:
-        """Process all commands in sequence."""
-        results = []
-        for item in items:
-            if item is not None:
-                results.append(item)
-        return results
-
-    def command(self, items: List[Any]) -> Any:
-        """Execute a single command."""
-        return items[0]
-
-    def visual_lines(self, items: List[Any]) -> str:
+        # Rule handlers are all @v_args wrapped: keep (wrapper, handler) pairs
+        self._rule_handlers = {
+            name: (handler.visit_wrapper, handler)
+            for name, handler in ((name, getattr(self, name)) for name in self._RULES)
+        }
+        self._token_handlers = {name: getattr(self, name) for name in self._TERMINALS}
+
+    def _call_userfunc(self, tree: Tree, new_children: List[Any] = None) -> Any:
+        """Dispatch a rule node through the bound handler table."""
+        entry = self._rule_handlers.get(tree.data)
+        if entry is None:
+            return super()._call_userfunc(tree, new_children)
+        wrapper, handler = entry
+        children = new_children if new_children is not None else tree.children
+        try:
+            return wrapper(handler, tree.data, children, tree.meta)
+        except GrammarError:
+            raise
+        except Exception as e:
+            raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token: Any) -> Any:
+        """Dispatch a terminal through the bound handler table."""
+        handler = self._token_handlers.get(token.type)
+        if handler is None:
+            return super()._call_userfunc_token(token)
+        try:
+            return handler(token)
+        except GrammarError:
+            raise
+        except Exception as e:
+            raise VisitError(token.type, token, e)
+
+    def compile(self, tree: Tree) -> List[Operation]:
+        """Compile a parse tree into operations without executing them."""
+        return super().transform(tree)
+
+    def run(self, operations: List[Operation]) -> List[CommandResult]:
+        """Execute compiled operations in order, returning their results."""
+        nvim = self.nvim
+        return [command(nvim, *args) for command, args in operations]
+
+    def transform(self, tree: Tree) -> List[CommandResult]:
+        """Compile and execute a parse tree, returning one result per command."""
+        return self.run(self.compile(tree))
+
+    @v_args(inline=True)
+    def start(self, *commands: Operation) -> List[Operation]:
+        """Collect all commands in sequence."""
+        return [command for command in commands if command is not None]
+
+    @v_args(inline=True)
+    def command(self, operation: Operation) -> Operation:
+        """Compile a single command."""
+        return operation
+
+    @v_args(inline=True)
+    def visual_lines(self, lines: Tuple[int, int]) -> Operation:
         """Transform VISUAL LINES command."""
-        start_line = int(items[0])
-        end_line = int(items[1])
-        return visual_lines_command(self.nvim, start_line, end_line)
+        return visual_lines_command, lines
 
-    def insert_text(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def insert_text(self, text: str, line_num: int = None) -> Operation:
         """Transform INSERT command (supports both single-line and multi-line text)."""
-        # First item is the text (either STRING or MULTILINE_STRING)
-        text = items[0]
-
-        # Remove quotes based on string type
-        if text.startswith('"""') and text.endswith('"""'):
-            # Multi-line string - strip triple quotes
-            text = text[3:-3]
-        else:
-            # Regular string - strip single/double quotes
-            text = text.strip("\"'")
-
-        line_num = None
-
-        # Check if AT LINE was specified
-        if len(items) > 1 and items[1] is not None:
-            line_num = int(items[1])
-
-        return insert_text_command(self.nvim, text, line_num)
+        # line_num is only passed when AT LINE was specified
+        return insert_text_command, (text, line_num)
 
-    def delete_command(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def delete_command(self, target: Operation = None) -> Operation:
         """Transform DELETE command (with optional target)."""
-        if not items or items[0] is None:
+        if target is None:
             # No target specified - regular DELETE (character/selection)
-            return delete_command(self.nvim)
+            return delete_command, ()
         else:
-            # Target specified - should be handled by delete_target -> lines_range
-            return items[0]
+            # Target specified - already compiled by delete_target
+            return target
 
-    def delete_target(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def delete_target(self, lines: Tuple[int, int]) -> Operation:
         """Process delete target (currently only lines_range)."""
-        return items[0]
+        return delete_lines_command, lines
 
-    def lines_range(self, items: List[Any]) -> str:
-        """Transform LINES start TO end."""
-        start_line = int(items[0])
-        end_line = int(items[1])
-        return delete_lines_command(self.nvim, start_line, end_line)
+    @v_args(inline=True)
+    def lines_range(self, start_line: int, end_line: int) -> Tuple[int, int]:
+        """Transform LINES start TO end into a (start, end) pair."""
+        return start_line, end_line
 
-    def goto_line(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def goto_line(self, line_num: int) -> Operation:
         """Transform GOTO LINE command."""
-        line_num = int(items[0])
-        return goto_line_command(self.nvim, line_num)
+        return goto_line_command, (line_num,)
 
-    def find_text(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def find_text(self, pattern: str) -> Operation:
         """Transform FIND command."""
-        pattern = items[0].strip('"')  # Remove quotes
-        return find_text_command(self.nvim, pattern)
+        return find_text_command, (pattern,)
 
-    def replace_text(self, items: List[Any]) -> str:
+    @v_args(inline=True)
+    def replace_text(self, old_pattern: str, new_text: str) -> Operation:
         """Transform REPLACE command."""
-        old_pattern = items[0].strip('"')  # Remove quotes
-        new_text = items[1].strip('"')  # Remove quotes
-        return replace_text_command(self.nvim, old_pattern, new_text)
+        return replace_text_command, (old_pattern, new_text)
 
-    def at_line(self, items: List[Any]) -> int:
+    @v_args(inline=True)
+    def at_line(self, line_num: int) -> int:
         """Process AT LINE n clause."""
-        return int(items[0])
+        return line_num
 
-    # Handle terminal tokens
+    # Handle terminal tokens - decode each value once, so rules receive
+    # native types. The grammar guarantees the delimiters, so they are
+    # sliced off rather than stripped, which would also eat quotes that
+    # belong to the text.
     def STRING(self, token: str) -> str:
         """Process STRING tokens (single-line quoted strings)."""
-        return str(token)
+        return token[1:-1]
 
     def MULTILINE_STRING(self, token: str) -> str:
         """Process MULTILINE_STRING tokens (triple-quoted strings)."""
-        return str(token)
+        return token[3:-3]
 
-    def NUMBER(self, token: str) -> str:
+    def NUMBER(self, token: str) -> int:
         """Process NUMBER tokens."""
-        return str(token)
+        return int(token)
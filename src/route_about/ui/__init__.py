@@ -5,31 +5,41 @@ This module provides reusable components for enhanced terminal input,
 Rich-based display functions, and demo utilities.
 """
 
-# Import and re-export all components
-from .prompt import SimplePrompt, console, USING_PROMPT_TOOLKIT, USING_READLINE
-from .display import (
-    show_welcome,
-    show_commands,
-    show_buffer,
-    execute_and_display,
-    show_help,
-    show_history,
-    show_interactive_instructions,
-)
-from .demo_utils import setup_demo_buffer
+from importlib import import_module
+
+# Exported names and the submodule defining each. Submodules are imported
+# on first access (PEP 562), so e.g. using the console alone never loads
+# the Rich layout modules behind the display functions.
+_EXPORTS = {
+    "SimplePrompt": "prompt",
+    "console": "prompt",
+    "USING_PROMPT_TOOLKIT": "prompt",
+    "USING_READLINE": "prompt",
+    "show_welcome": "display",
+    "show_commands": "display",
+    "show_buffer": "display",
+    "execute_and_display": "display",
+    "show_help": "display",
+    "show_history": "display",
+    "show_interactive_instructions": "display",
+    "setup_demo_buffer": "demo_utils",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 # Make everything available at package level
-__all__ = [
-    "SimplePrompt",
-    "console",
-    "USING_PROMPT_TOOLKIT",
-    "USING_READLINE",
-    "show_welcome",
-    "show_commands",
-    "show_buffer",
-    "execute_and_display",
-    "show_help",
-    "show_history",
-    "show_interactive_instructions",
-    "setup_demo_buffer",
-]
+__all__ = list(_EXPORTS)
@@ -13,5 +13,5 @@ def setup_demo_buffer(nvim):
         "Sample text for testing",
         "Final line",
     ]
-    nvim.current.buffer[:] = content
+    nvim.api.buf_set_lines(0, 0, -1, False, content)
     return content
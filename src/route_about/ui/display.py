@@ -2,11 +2,14 @@
 Rich terminal display functions for the DSL demo.
 """
 
-from typing import List
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.syntax import Syntax
 from rich.text import Text
 from rich.align import Align
 from rich import box
@@ -15,9 +18,75 @@ from .prompt import USING_PROMPT_TOOLKIT, USING_READLINE, get_input_method_info
 
 console = Console()
 
+# Commands finishing faster than this never show a spinner
+SPINNER_DELAY = 0.1
+
+# Smoothing factor for the per-keyword execution time average
+TIMING_ALPHA = 0.3
+
+# Exponentially weighted average execution time, keyed by command keyword
+_command_timings: Dict[str, float] = {}
+
+# Buffers longer than this are shown as a window around the cursor
+SHOW_BUFFER_MAX_LINES = 200
+
+_AVAILABLE_COMMANDS = (
+    ("VISUAL LINES", "<start> TO <end>", "Select line range"),
+    ("INSERT", '"text" [AT LINE <n>]', "Insert text at cursor or line"),
+    ("INSERT", '"""multi-line""" [AT LINE <n>]', "Insert multi-line text"),
+    ("DELETE", "", "Delete character/selection"),
+    ("DELETE LINES", "<start> TO <end>", "Delete line range"),
+    ("GOTO LINE", "<n>", "Move cursor to line"),
+    ("FIND", '"pattern"', "Search for text"),
+    ("REPLACE", '"old" WITH "new"', "Replace all occurrences"),
+)
+
+_HELP_EXAMPLES = (
+    'INSERT "Hello World!"',
+    'INSERT "New line" AT LINE 5',
+    'INSERT """Line 1\nLine 2\nLine 3""" AT LINE 10',
+    "VISUAL LINES 1 TO 3",
+    "DELETE",
+    "GOTO LINE 10",
+    'FIND "search_term"',
+    'REPLACE "old" WITH "new"',
+    "DELETE LINES 5 TO 7",
+)
+
+# Keyboard shortcuts only exist with prompt_toolkit, which is fixed at import
+_SHORTCUTS_TEXT = (
+    "\n[bold yellow]⌨️  Shortcuts:[/bold yellow]\n"
+    "  [cyan]↑/↓[/cyan] - Navigate history\n"
+    "  [cyan]←/→[/cyan] - Move cursor\n"
+    "  [cyan]Tab[/cyan] - Auto-complete\n"
+    "  [cyan]Ctrl+R[/cyan] - Search history"
+    if USING_PROMPT_TOOLKIT
+    else None
+)
+
+
+@contextmanager
+def _deferred_status(message: str):
+    """Show a status spinner only if the block runs longer than SPINNER_DELAY."""
+    if not console.is_terminal:
+        yield
+        return
 
-def show_welcome():
-    """Show welcome banner."""
+    status = console.status(message, spinner="dots")
+    timer = threading.Timer(SPINNER_DELAY, status.start)
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        # Wait for a start() that already fired, then tear it down
+        timer.join()
+        status.stop()
+
+
+@lru_cache(maxsize=1)
+def _welcome_panel() -> Panel:
+    """Build the welcome banner once; the input method is fixed at import."""
     title = Text("RouteAbout DSL Interactive Mode", style="bold magenta")
 
     input_info_text = get_input_method_info()
@@ -28,53 +97,119 @@ def show_welcome():
     else:
         input_info = Text(f"⚠️  {input_info_text}", style="red")
 
-    welcome_panel = Panel(
+    return Panel(
         Align.center(f"{title}\n\n{input_info}"),
         box=box.DOUBLE,
         padding=(1, 2),
         style="bright_blue",
     )
-    console.print(welcome_panel)
 
 
-def show_commands():
-    """Show available DSL commands."""
-    commands = [
-        ("VISUAL LINES", "<start> TO <end>", "Select line range"),
-        ("INSERT", '"text" [AT LINE <n>]', "Insert text at cursor or line"),
-        ("INSERT", '"""multi-line""" [AT LINE <n>]', "Insert multi-line text"),
-        ("DELETE", "", "Delete character/selection"),
-        ("DELETE LINES", "<start> TO <end>", "Delete line range"),
-        ("GOTO LINE", "<n>", "Move cursor to line"),
-        ("FIND", '"pattern"', "Search for text"),
-        ("REPLACE", '"old" WITH "new"', "Replace all occurrences"),
-    ]
+def show_welcome():
+    """Show welcome banner."""
+    console.print(_welcome_panel())
+
 
+@lru_cache(maxsize=1)
+def _commands_table() -> Table:
+    """Build the available-commands table once; it is reprinted as-is."""
     table = Table(title="Available Commands", box=box.ROUNDED, title_style="bold green")
     table.add_column("Command", style="cyan", width=12)
     table.add_column("Syntax", style="yellow", width=25)
     table.add_column("Description", style="white")
 
-    for cmd, syntax, desc in commands:
+    for cmd, syntax, desc in _AVAILABLE_COMMANDS:
         table.add_row(cmd, syntax, desc)
 
-    console.print(table)
+    return table
+
 
+def show_commands():
+    """Show available DSL commands."""
+    console.print(_commands_table())
 
-def show_buffer(nvim, title: str = "Buffer Content"):
-    """Display current buffer content with line numbers."""
-    table = Table(title=title, box=box.ROUNDED, title_style="bold cyan")
-    table.add_column("Line", style="dim", width=4, justify="right")
-    table.add_column("Content", style="white")
 
-    for i, line in enumerate(nvim.current.buffer, 1):
-        table.add_row(str(i), line)
+def _buffer_window(nvim):
+    """Fetch the lines to display: (first line number, lines, total lines).
 
-    console.print(table)
+    Buffers up to SHOW_BUFFER_MAX_LINES come back whole in one request;
+    longer ones are cut to a window of that size around the cursor.
+    """
+    results, error = nvim.api.call_atomic(
+        [
+            ["nvim_buf_line_count", [0]],
+            ["nvim_win_get_cursor", [0]],
+            ["nvim_buf_get_lines", [0, 0, SHOW_BUFFER_MAX_LINES, False]],
+        ]
+    )
+    if error is not None:
+        from pynvim import NvimError
+
+        raise NvimError(error[2])
+    total, (row, _), lines = results
+    if total <= SHOW_BUFFER_MAX_LINES:
+        return 1, lines, total
+
+    start = max(
+        0, min(row - 1 - SHOW_BUFFER_MAX_LINES // 2, total - SHOW_BUFFER_MAX_LINES)
+    )
+    if start > 0:
+        lines = nvim.api.buf_get_lines(0, start, start + SHOW_BUFFER_MAX_LINES, False)
+    return start + 1, lines, total
+
+
+def show_buffer(nvim, title: str = "Buffer Content", lines: List[str] = None):
+    """Display current buffer content with line numbers.
+
+    Pass lines when the content is already known (e.g. just written)
+    to skip reading it back from Neovim. Large buffers are shown as a
+    window around the cursor.
+    """
+    if lines is None:
+        first, lines, total = _buffer_window(nvim)
+    else:
+        first, total = 1, len(lines)
+
+    last = first + len(lines) - 1
+    note = f"Showing lines {first}-{last} of {total}" if len(lines) < total else None
+
+    # Redirected output - skip Rich layout entirely
+    if not console.is_terminal:
+        print("\n".join(f"{i:>4}  {line}" for i, line in enumerate(lines, first)))
+        if note:
+            print(note)
+        return
+
+    # Render the whole buffer as one line-numbered block rather than
+    # building and measuring a table row per line
+    from rich.syntax import Syntax
+
+    content = Syntax(
+        "\n".join(lines),
+        "text",
+        theme="monokai",
+        background_color="default",
+        line_numbers=True,
+        start_line=first,
+        word_wrap=True,
+    )
+    buffer_panel = Panel(
+        content,
+        title=f"[bold cyan]{title}",
+        box=box.ROUNDED,
+        border_style="cyan",
+        expand=False,
+    )
+    console.print(buffer_panel)
+    if note:
+        console.print(f"[dim]{note}[/dim]")
 
 
 def execute_and_display(executor, nvim, cmd: str):
     """Execute a command and display the result."""
+    # Deferred: rich.syntax pulls in Pygments
+    from rich.syntax import Syntax
+
     # Show command
     cmd_panel = Panel(
         Syntax(cmd, "text", theme="monokai", background_color="default"),
@@ -85,8 +220,20 @@ def execute_and_display(executor, nvim, cmd: str):
     console.print(cmd_panel)
 
     # Execute
-    with console.status("[bold yellow]Executing...", spinner="dots"):
+    # Commands whose keyword usually finishes well under SPINNER_DELAY skip
+    # the spinner timer thread entirely
+    keyword = cmd.split(None, 1)[0].upper() if cmd.strip() else ""
+    typical = _command_timings.get(keyword)
+    started = time.perf_counter()
+    if typical is not None and typical < SPINNER_DELAY / 2:
         result = executor.execute(cmd)
+    else:
+        with _deferred_status("[bold yellow]Executing..."):
+            result = executor.execute(cmd)
+    elapsed = time.perf_counter() - started
+    _command_timings[keyword] = (
+        elapsed if typical is None else typical + TIMING_ALPHA * (elapsed - typical)
+    )
 
     # Show result
     if "Error" in result:
@@ -97,28 +244,12 @@ def execute_and_display(executor, nvim, cmd: str):
 
 def show_help():
     """Show help and examples."""
-    examples = [
-        'INSERT "Hello World!"',
-        'INSERT "New line" AT LINE 5',
-        'INSERT """Line 1\nLine 2\nLine 3""" AT LINE 10',
-        "VISUAL LINES 1 TO 3",
-        "DELETE",
-        "GOTO LINE 10",
-        'FIND "search_term"',
-        'REPLACE "old" WITH "new"',
-        "DELETE LINES 5 TO 7",
-    ]
-
     console.print("\n[bold yellow]📚 Example Commands:[/bold yellow]")
-    for example in examples:
+    for example in _HELP_EXAMPLES:
         console.print(f"  [cyan]•[/cyan] [green]{example}[/green]")
 
-    if USING_PROMPT_TOOLKIT:
-        console.print(f"\n[bold yellow]⌨️  Shortcuts:[/bold yellow]")
-        console.print("  [cyan]↑/↓[/cyan] - Navigate history")
-        console.print("  [cyan]←/→[/cyan] - Move cursor")
-        console.print("  [cyan]Tab[/cyan] - Auto-complete")
-        console.print("  [cyan]Ctrl+R[/cyan] - Search history")
+    if _SHORTCUTS_TEXT:
+        console.print(_SHORTCUTS_TEXT)
 
 
 def show_history(history: List[str]):
@@ -143,8 +274,9 @@ def show_history(history: List[str]):
         console.print(f"[dim]Showing last 20 of {len(history)} commands[/dim]")
 
 
-def show_interactive_instructions():
-    """Show interactive mode instructions."""
+@lru_cache(maxsize=1)
+def _interactive_panel() -> Panel:
+    """Build the interactive-mode instructions panel once."""
     instructions = (
         "[bold cyan]Interactive DSL Shell[/bold cyan]\n\n"
         "[yellow]Commands:[/yellow]\n"
@@ -156,10 +288,14 @@ def show_interactive_instructions():
         "[dim]💡 Tip: Use Ctrl+C to exit anytime[/dim]"
     )
 
-    interactive_panel = Panel(
+    return Panel(
         instructions,
         title="🎮 Interactive Mode",
         box=box.DOUBLE,
         border_style="magenta",
     )
-    console.print(interactive_panel)
+
+
+def show_interactive_instructions():
+    """Show interactive mode instructions."""
+    console.print(_interactive_panel())
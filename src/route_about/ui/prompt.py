@@ -2,24 +2,19 @@
 Terminal input handling with history and completion.
 """
 
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import takewhile
+from importlib.util import find_spec
 from typing import List
 from rich.console import Console
 
-# Terminal input handling - check for available libraries
-USING_PROMPT_TOOLKIT = False
+# Terminal input handling - check for available libraries. prompt_toolkit is
+# only located here; it is imported when the first SimplePrompt is created.
+USING_PROMPT_TOOLKIT = find_spec("prompt_toolkit") is not None
 USING_READLINE = False
 
-try:
-    from prompt_toolkit import prompt
-    from prompt_toolkit.history import InMemoryHistory
-    from prompt_toolkit.completion import WordCompleter
-    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-    from prompt_toolkit.shortcuts import CompleteStyle
-
-    USING_PROMPT_TOOLKIT = True
-except ImportError:
-    pass
-
 if not USING_PROMPT_TOOLKIT:
     try:
         import readline
@@ -30,45 +25,79 @@ if not USING_PROMPT_TOOLKIT:
 
 console = Console()
 
+# DSL commands for completion
+DSL_COMMANDS = (
+    "INSERT",
+    "DELETE",
+    "DELETE LINES",
+    "GOTO LINE",
+    "FIND",
+    "REPLACE",
+    "VISUAL LINES",
+    "AT LINE",
+    "TO",
+    "WITH",
+    "help",
+    "show",
+    "clear",
+    "history",
+    "quit",
+    "exit",
+)
+
+# Candidates sorted by their lowercase form, so the commands sharing a
+# prefix form one contiguous run that bisect can find
+_DSL_SORTED = tuple(sorted({cmd.lower(): cmd for cmd in DSL_COMMANDS}.items()))
+_DSL_KEYS = tuple(lower for lower, _ in _DSL_SORTED)
+
+
+@lru_cache(maxsize=1)
+def _word_completer():
+    """Build the prompt_toolkit completer once; the candidates are constant."""
+    from prompt_toolkit.completion import WordCompleter
+
+    return WordCompleter(list(DSL_COMMANDS), ignore_case=True)
+
+
+@lru_cache(maxsize=64)
+def _complete_matches(prefix: str) -> tuple:
+    """Return DSL commands starting with a lowercase prefix."""
+    start = bisect_left(_DSL_KEYS, prefix)
+    matches = takewhile(lambda pair: pair[0].startswith(prefix), _DSL_SORTED[start:])
+    return tuple(cmd for _, cmd in matches)
+
 
 class SimplePrompt:
     """Simple prompt handler with history and completion."""
 
     def __init__(self):
-        self.history: List[str] = []
-
-        # DSL commands for completion
-        dsl_commands = [
-            "INSERT",
-            "DELETE",
-            "DELETE LINES",
-            "GOTO LINE",
-            "FIND",
-            "REPLACE",
-            "VISUAL LINES",
-            "AT LINE",
-            "TO",
-            "WITH",
-            "help",
-            "show",
-            "clear",
-            "history",
-            "quit",
-            "exit",
-        ]
+        # Insertion-ordered set: O(1) duplicate checks and oldest-first eviction
+        self._history: OrderedDict[str, None] = OrderedDict()
 
         if USING_PROMPT_TOOLKIT:
+            from prompt_toolkit import prompt
+            from prompt_toolkit.history import InMemoryHistory
+            from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+            from prompt_toolkit.shortcuts import CompleteStyle
+
+            self._pt_prompt = prompt
             self.pt_history = InMemoryHistory()
-            self.completer = WordCompleter(dsl_commands, ignore_case=True)
+            self.completer = _word_completer()
+            self._pt_options = {
+                "history": self.pt_history,
+                "completer": self.completer,
+                "complete_style": CompleteStyle.READLINE_LIKE,
+                "auto_suggest": AutoSuggestFromHistory(),
+                "enable_history_search": True,
+            }
         elif USING_READLINE:
             readline.parse_and_bind("tab: complete")
             readline.parse_and_bind('"\\e[A": history-search-backward')
             readline.parse_and_bind('"\\e[B": history-search-forward')
 
             def complete_dsl(text, state):
-                matches = [
-                    cmd for cmd in dsl_commands if cmd.lower().startswith(text.lower())
-                ]
+                # readline calls this once per state; the matches are cached
+                matches = _complete_matches(text.lower())
                 try:
                     return matches[state]
                 except IndexError:
@@ -76,82 +105,77 @@ class SimplePrompt:
 
             readline.set_completer(complete_dsl)
 
+        # Resolve the input backend once rather than on every prompt
+        if USING_PROMPT_TOOLKIT:
+            self._read_line = self._read_line_pt
+            self._read_continuation = self._read_continuation_pt
+        else:
+            self._console_input = console.input if USING_READLINE else input
+            self._read_line = self._read_line_console
+            self._read_continuation = self._read_continuation_console
+
+    def _read_line_pt(self, prompt_text: str) -> str:
+        """Read the first line with prompt_toolkit (plain text prompt)."""
+        return self._pt_prompt(f"{prompt_text}> ", **self._pt_options)
+
+    def _read_continuation_pt(self) -> str:
+        """Read a continuation line with prompt_toolkit."""
+        return self._pt_prompt("... ")
+
+    def _read_line_console(self, prompt_text: str) -> str:
+        """Read the first line through the console (readline or plain input)."""
+        console.print(f"[bold green]{prompt_text}[/bold green]> ", end="")
+        return self._console_input()
+
+    def _read_continuation_console(self) -> str:
+        """Read a continuation line through the console."""
+        console.print("... ", end="")
+        return self._console_input()
+
+    @property
+    def history(self) -> List[str]:
+        """Command history, oldest first."""
+        return list(self._history)
+
     def get_input(self, prompt_text: str = "stvim") -> str:
         """Get user input with enhanced features and multi-line support."""
-
-        def _get_single_line(prompt_str):
-            """Get a single line of input."""
-            if USING_PROMPT_TOOLKIT:
-                return prompt(prompt_str)  # prompt_toolkit handles its own styling
-            elif USING_READLINE:
-                console.print(f"[bold green]{prompt_text}[/bold green]> ", end="")
-                return console.input()
-            else:
-                console.print(f"[bold green]{prompt_text}[/bold green]> ", end="")
-                return input()
-
         try:
-            # Get the first line - use plain text for prompt_toolkit
-            if USING_PROMPT_TOOLKIT:
-                result = prompt(
-                    f"{prompt_text}> ",
-                    history=self.pt_history,
-                    completer=self.completer,
-                    complete_style=CompleteStyle.READLINE_LIKE,
-                    auto_suggest=AutoSuggestFromHistory(),
-                    enable_history_search=True,
-                )
-            else:
-                result = _get_single_line(f"{prompt_text}> ")
-
-            # Check if this starts a multi-line string
-            if '"""' in result:
-                # Count triple quotes to see if string is complete
-                triple_quote_count = result.count('"""')
-
-                # If odd number of triple quotes, the string is incomplete
-                if triple_quote_count % 2 == 1:
-                    lines = [result]
-
-                    # Continue reading lines until we get the closing """
-                    while True:
-                        try:
-                            if USING_PROMPT_TOOLKIT:
-                                continuation = prompt("... ")
-                            else:
-                                console.print("... ", end="")
-                                continuation = (
-                                    console.input() if USING_READLINE else input()
-                                )
-
-                            lines.append(continuation)
-
-                            # Check if this line completes the multi-line string
-                            if '"""' in continuation:
-                                # Join all lines and count total triple quotes
-                                full_text = "\n".join(lines)
-                                total_triple_quotes = full_text.count('"""')
-
-                                # If even number, the string is complete
-                                if total_triple_quotes % 2 == 0:
-                                    result = full_text
-                                    break
-                        except (KeyboardInterrupt, EOFError):
-                            # If user interrupts, return what we have so far
-                            result = "\n".join(lines)
-                            break
-
-            # Add to history if not empty and not duplicate
-            if result.strip() and result.strip() not in self.history:
-                self.history.append(result.strip())
-                if len(self.history) > 100:
-                    self.history.pop(0)
+            result = self._read_line(prompt_text)
+
+            # An odd number of triple quotes means a multi-line string is open
+            string_open = result.count('"""') % 2 == 1
+            if string_open:
+                lines = [result]
+
+                # Continue reading lines until we get the closing """. A
+                # triple quote cannot span a newline, so each new line only
+                # needs its own count to update the running parity.
+                while string_open:
+                    try:
+                        continuation = self._read_continuation()
+                        lines.append(continuation)
+                        if continuation.count('"""') % 2 == 1:
+                            string_open = False
+                    except (KeyboardInterrupt, EOFError):
+                        # If user interrupts, return what we have so far
+                        break
+
+                result = "\n".join(lines)
+
+            # Add to history if not empty; repeats move to the most recent slot
+            command = result.strip()
+            if command in self._history:
+                self._history.move_to_end(command)
+            elif command:
+                self._history[command] = None
+                if len(self._history) > 100:
+                    self._history.popitem(last=False)
 
                 # Also add to readline history if using it
                 if USING_READLINE:
-                    readline.add_history(result.strip())
+                    readline.add_history(command)
 
-            return result.strip()
+            return command
 
         except (KeyboardInterrupt, EOFError):
             raise KeyboardInterrupt()